@@ -3,6 +3,7 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from model_loader import ConversationalRAG
+import os
 import time
 import threading
 import traceback
@@ -20,6 +21,9 @@ CORS(app)
 SESSION_TIMEOUT_SECONDS = 3600  # 1 hour
 CLEANUP_INTERVAL_SECONDS = 600 # 10 minutes
 
+# Load shared models at startup instead of on the first /api/init (set to "0" for faster dev restarts)
+PRELOAD_MODELS = os.environ.get("PRELOAD_MODELS", "1") == "1"
+
 # A thread-safe dictionary to hold active RAG instances
 active_sessions = {}
 _sessions_lock = threading.Lock()
@@ -191,5 +195,11 @@ if __name__ == "__main__":
     # Start cleanup thread
     cleanup_thread = threading.Thread(target=cleanup_inactive_sessions, daemon=True)
     cleanup_thread.start()
+    if PRELOAD_MODELS:
+        try:
+            logger.info("Preloading embedding model...")
+            ConversationalRAG.get_shared_embeddings()
+        except Exception as e:
+            logger.error(f"Embedding model preload failed, will retry on first session: {e}")
     logger.info("Starting Flask server on port 5001...")
     app.run(host="0.0.0.0", port=5001, debug=False)
\ No newline at end of file
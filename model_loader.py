@@ -14,9 +14,25 @@ import json
 import shutil
 import logging
 import time
+import threading
 import traceback
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
 class ConversationalRAG:
+    EMBEDDING_MODEL_NAME = "sentence-transformers/all-mpnet-base-v2"
+
+    # Embedding models are loaded once per process and shared by every session
+    _embeddings_cache = {}
+    _embeddings_cache_lock = threading.Lock()
+
+    # Latest (fingerprint, vector store) built per documents folder, reused across sessions
+    _vectorstore_cache = {}
+    _vectorstore_cache_lock = threading.Lock()
+
     def __init__(self, session_id: str, documents_folder="documents"):
         self.session_id = session_id
         self.session_path = os.path.join("user_sessions", session_id)
@@ -59,6 +75,19 @@ class ConversationalRAG:
             self.logger.error(f"Full traceback: {traceback.format_exc()}")
             raise
 
+    @classmethod
+    def get_shared_embeddings(cls):
+        """Return the process-wide embedding model, loading it on first use"""
+        with cls._embeddings_cache_lock:
+            embeddings = cls._embeddings_cache.get(cls.EMBEDDING_MODEL_NAME)
+            if embeddings is None:
+                embeddings = HuggingFaceEmbeddings(
+                    model_name=cls.EMBEDDING_MODEL_NAME,
+                    model_kwargs={'device': 'cpu'}  # Ensure CPU usage
+                )
+                cls._embeddings_cache[cls.EMBEDDING_MODEL_NAME] = embeddings
+            return embeddings
+
     def complete_system_reset(self):
         """Clean up session resources"""
         self.logger.info(f"Cleaning up session at: {self.session_path}")
@@ -131,10 +160,7 @@ You can try asking one of these suggestions:
     def setup_embeddings(self):
         """Initialize embeddings with error handling"""
         try:
-            self.embeddings = HuggingFaceEmbeddings(
-                model_name="sentence-transformers/all-mpnet-base-v2",
-                model_kwargs={'device': 'cpu'}  # Ensure CPU usage
-            )
+            self.embeddings = self.get_shared_embeddings()
             self.logger.info("Embeddings initialized successfully")
         except Exception as e:
             self.logger.error(f"Error setting up embeddings: {e}")
@@ -158,8 +184,20 @@ You can try asking one of these suggestions:
             self.logger.error(f"Error setting up vector store: {e}")
             raise Exception(f"Failed to initialize vector store: {e}")
 
+    def _documents_fingerprint(self, pdf_files):
+        """Build a cache key that changes whenever the PDF set or contents change"""
+        files = []
+        for pdf_file in sorted(pdf_files):
+            try:
+                stat = os.stat(pdf_file)
+            except FileNotFoundError:
+                # Deleted since listing; the build will log it and skip caching
+                continue
+            files.append((os.path.basename(pdf_file), stat.st_size, stat.st_mtime_ns))
+        return tuple(files)
+
     def create_vector_store_from_documents(self):
-        """Create vector store from PDF documents with comprehensive error handling"""
+        """Create vector store from PDF documents, reusing one already built for identical documents"""
         try:
             pdf_files = []
             if os.path.exists(self.documents_folder):
@@ -168,49 +206,24 @@ You can try asking one of these suggestions:
                     for f in os.listdir(self.documents_folder) 
                     if f.lower().endswith('.pdf')
                 ]
-            
-            if not pdf_files:
-                self.logger.warning("No PDF files found, creating empty vector store")
-                # Create a dummy document to avoid empty vector store issues
-                dummy_doc = Document(
-                    page_content="This is a placeholder document. Please upload PDF files to the documents folder.",
-                    metadata={"source": "system", "page": 0}
-                )
-                vectorstore = FAISS.from_documents([dummy_doc], self.embeddings)
-                vectorstore.save_local(self.vector_store_path)
-                return vectorstore
-            
-            self.logger.info(f"Processing {len(pdf_files)} PDF files")
-            all_docs = []
-            
-            for pdf_file in pdf_files:
-                try:
-                    self.logger.info(f"Loading PDF: {pdf_file}")
-                    loader = PyPDFLoader(pdf_file)
-                    documents = loader.load()
-                    
-                    if not documents:
-                        self.logger.warning(f"No content found in {pdf_file}")
-                        continue
-                        
-                    text_splitter = CharacterTextSplitter(
-                        chunk_size=1000, 
-                        chunk_overlap=30, 
-                        separator="\n"
-                    )
-                    docs = text_splitter.split_documents(documents)
-                    all_docs.extend(docs)
-                    self.logger.info(f"Added {len(docs)} chunks from {pdf_file}")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error processing PDF {pdf_file}: {e}")
-                    continue
-            
-            if not all_docs:
-                raise Exception("No valid documents could be processed from PDF files")
-                
-            self.logger.info(f"Creating vector store with {len(all_docs)} total chunks")
-            vectorstore = FAISS.from_documents(all_docs, self.embeddings)
+
+            cache_key = os.path.abspath(self.documents_folder)
+            fingerprint = self._documents_fingerprint(pdf_files)
+            with ConversationalRAG._vectorstore_cache_lock:
+                cached = ConversationalRAG._vectorstore_cache.get(cache_key)
+                if cached is not None and cached[0] == fingerprint:
+                    vectorstore = cached[1]
+                    self.logger.info("Reusing vector store built for an earlier session")
+                else:
+                    vectorstore, complete = self._build_vector_store(pdf_files)
+                    if complete:
+                        # Replaces any index built from an older version of the folder
+                        ConversationalRAG._vectorstore_cache[cache_key] = (fingerprint, vectorstore)
+                    else:
+                        # Leave partial indexes uncached so the next session retries the failed files
+                        ConversationalRAG._vectorstore_cache.pop(cache_key, None)
+                        self.logger.warning("Some PDFs failed to load, not caching this vector store")
+
             vectorstore.save_local(self.vector_store_path)
             return vectorstore
             
@@ -218,6 +231,52 @@ You can try asking one of these suggestions:
             self.logger.error(f"Error creating vector store: {e}")
             raise Exception(f"Failed to create vector store: {e}")
 
+    def _build_vector_store(self, pdf_files):
+        """Load, split and embed PDFs into a new FAISS index; returns (vectorstore, all_files_loaded)"""
+        if not pdf_files:
+            self.logger.warning("No PDF files found, creating empty vector store")
+            # Create a dummy document to avoid empty vector store issues
+            dummy_doc = Document(
+                page_content="This is a placeholder document. Please upload PDF files to the documents folder.",
+                metadata={"source": "system", "page": 0}
+            )
+            return FAISS.from_documents([dummy_doc], self.embeddings), True
+        
+        self.logger.info(f"Processing {len(pdf_files)} PDF files")
+        all_docs = []
+        complete = True
+        
+        for pdf_file in pdf_files:
+            try:
+                self.logger.info(f"Loading PDF: {pdf_file}")
+                loader = PyPDFLoader(pdf_file)
+                # Drop pages with no text layer (blank or scanned) before splitting/embedding
+                documents = [doc for doc in loader.load() if doc.page_content.strip()]
+
+                if not documents:
+                    self.logger.warning(f"No content found in {pdf_file}")
+                    continue
+                    
+                text_splitter = CharacterTextSplitter(
+                    chunk_size=1000, 
+                    chunk_overlap=30, 
+                    separator="\n"
+                )
+                docs = text_splitter.split_documents(documents)
+                all_docs.extend(docs)
+                self.logger.info(f"Added {len(docs)} chunks from {pdf_file}")
+                
+            except Exception as e:
+                self.logger.error(f"Error processing PDF {pdf_file}: {e}")
+                complete = False
+                continue
+        
+        if not all_docs:
+            raise Exception("No valid documents could be processed from PDF files")
+            
+        self.logger.info(f"Creating vector store with {len(all_docs)} total chunks")
+        return FAISS.from_documents(all_docs, self.embeddings), complete
+
     def setup_qa_chain(self):
         """Initialize QA chain with error handling"""
         try:
@@ -239,10 +298,14 @@ You can try asking one of these suggestions:
         """Load conversation history with error handling"""
         try:
             if os.path.exists(self.conversation_file):
-                with open(self.conversation_file, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
-                    self.logger.info(f"Loaded {len(history)} conversation turns")
-                    return history
+                if orjson is not None:
+                    with open(self.conversation_file, 'rb') as f:
+                        history = orjson.loads(f.read())
+                else:
+                    with open(self.conversation_file, 'r', encoding='utf-8') as f:
+                        history = json.load(f)
+                self.logger.info(f"Loaded {len(history)} conversation turns")
+                return history
         except Exception as e:
             self.logger.error(f"Error loading conversation history: {e}")
         
@@ -251,8 +314,12 @@ You can try asking one of these suggestions:
     def save_conversation_history(self):
         """Save conversation history with error handling"""
         try:
-            with open(self.conversation_file, 'w', encoding='utf-8') as f:
-                json.dump(self.conversation_history, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(self.conversation_file, 'wb') as f:
+                    f.write(orjson.dumps(self.conversation_history, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.conversation_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.conversation_history, f, indent=2, ensure_ascii=False)
         except Exception as e:
             self.logger.error(f"Error saving conversation history: {e}")
 
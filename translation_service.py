@@ -2,15 +2,22 @@
 
 import py3langid as langid
 from googletrans import Translator
+from collections import OrderedDict
+import hashlib
 import logging
+import threading
 import time
 
 class TranslationService:
     def __init__(self):
         self.translator = Translator()
         self.logger = logging.getLogger(__name__)
-        self.cache = {}  # Simple cache to avoid repeated translations
-        self.rate_limit_delay = 0.1  # Small delay between requests
+        self.cache = OrderedDict()  # LRU cache to avoid repeated translations
+        self.cache_max_size = 1000
+        self._cache_lock = threading.Lock()
+        self.rate_limit_delay = 0.1  # Minimum spacing between request starts
+        self._rate_limit_lock = threading.Lock()
+        self._last_request_time = 0.0
         
         # Configure langid (optional: you can set specific languages if needed)
         # langid.set_languages(['en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'zh', 'ja', 'ko', 'ar', 'hi'])
@@ -73,12 +80,13 @@ class TranslationService:
                 return text
                 
             # Check cache first
-            cache_key = f"{source_language}:{target_language}:{text[:100]}"
-            if cache_key in self.cache:
-                return self.cache[cache_key]
+            cache_key = self._cache_key(text, target_language, source_language)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
             
-            # Add small delay to respect rate limits
-            time.sleep(self.rate_limit_delay)
+            # Respect rate limits without delaying requests that are already spaced out
+            self._wait_for_rate_limit()
             
             # Perform translation
             result = self.translator.translate(
@@ -90,7 +98,7 @@ class TranslationService:
             translated_text = result.text
             
             # Cache the result
-            self.cache[cache_key] = translated_text
+            self._cache_put(cache_key, translated_text)
             
             self.logger.info(f"Translated from {source_language} to {target_language}: {text[:30]}... -> {translated_text[:30]}...")
             return translated_text
@@ -99,6 +107,35 @@ class TranslationService:
             self.logger.error(f"Translation failed: {e}")
             return text  # Return original text if translation fails
     
+    def _cache_key(self, text, target_language, source_language):
+        """Key on a digest of the full text so texts sharing a prefix never collide"""
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        return (source_language, target_language, digest)
+    
+    def _cache_get(self, key):
+        """Return a cached translation and mark it as recently used, or None"""
+        with self._cache_lock:
+            translated_text = self.cache.get(key)
+            if translated_text is not None:
+                self.cache.move_to_end(key)
+            return translated_text
+    
+    def _cache_put(self, key, translated_text):
+        """Store a translation, evicting the least recently used entries over cache_max_size"""
+        with self._cache_lock:
+            self.cache[key] = translated_text
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.cache_max_size:
+                self.cache.popitem(last=False)
+    
+    def _wait_for_rate_limit(self):
+        """Block until at least rate_limit_delay has passed since the previous request started"""
+        with self._rate_limit_lock:
+            wait = self._last_request_time + self.rate_limit_delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request_time = time.monotonic()
+    
     def translate_to_english(self, text, source_language='auto'):
         """Translate any text to English"""
         return self.translate_text(text, 'en', source_language)
@@ -111,5 +148,6 @@ class TranslationService:
     
     def clear_cache(self):
         """Clear translation cache"""
-        self.cache.clear()
+        with self._cache_lock:
+            self.cache.clear()
         self.logger.info("Translation cache cleared")
\ No newline at end of file